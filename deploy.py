@@ -3,7 +3,7 @@
 Automated deployment script for qqgjyx.
 
 Usage:
-    python deploy.py [--version VERSION] [--message MESSAGE] [--skip-tests] [--skip-upload] [--all-tests] [--dry-run]
+    python deploy.py [--version VERSION] [--message MESSAGE] [--skip-tests] [--skip-upload] [--all-tests] [--verbose] [--dry-run]
     
 Examples:
     python deploy.py --version 0.1.3 --message "Add new feature"
@@ -13,67 +13,193 @@ Examples:
 """
 
 import argparse
+import asyncio
+import codecs
+import functools
+import hashlib
+import os
+import shlex
+import shutil
 import subprocess
 import sys
 import re
 from pathlib import Path
 
+PKG_ENV = "pkg-dev"
+INIT_FILE = Path("src/qqgjyx/__init__.py")
+PYPROJECT_FILE = Path("pyproject.toml")
+# Lives outside build/, which build_package wipes on every run
+INSTALL_HASH_FILE = Path(".deploy-cache/installed-hash")
+# The dev extra brings in pytest-xdist, build and twine used below
+INSTALL_TARGET = ".[dev]"
 
-def run_command(cmd, check=True, capture_output=True):
-    print(f"🔄 Running: {cmd}")
+_VERSION_PY_RE = re.compile(r'__version__ = "([^"]+)"')
+_VERSION_TOML_RE = re.compile(r'version = "([^"]+)"')
+
+
+def _report_failure(cmd, detail):
+    print(f"❌ Command failed: {cmd}")
+    if detail:
+        print(f"Error: {detail}")
+
+
+@functools.lru_cache(maxsize=None)
+def pkg_python() -> str:
+    """Resolve the interpreter of the ``pkg-dev`` conda env once per deploy."""
+    argv = ["conda", "run", "-n", PKG_ENV, "python", "-c", "import sys; print(sys.executable)"]
     try:
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            check=check,
-            capture_output=capture_output,
-            text=True,
-        )
-        if capture_output and result.stdout:
-            print(result.stdout)
-        return result
+        result = subprocess.run(argv, check=True, capture_output=True, text=True)
     except subprocess.CalledProcessError as e:
-        print(f"❌ Command failed: {cmd}")
-        if e.stderr:
-            print(f"Error: {e.stderr}")
+        _report_failure(shlex.join(argv), e.stderr or e.stdout)
+        sys.exit(1)
+    except OSError as e:
+        _report_failure(shlex.join(argv), str(e))
+        sys.exit(1)
+    return result.stdout.strip().splitlines()[-1]
+
+
+async def _collect(cmd, proc, check, capture):
+    output = errors = ""
+    try:
+        if capture:
+            # stderr has its own pipe here so callers parse stdout alone
+            stdout, stderr = await proc.communicate()
+            output, errors = stdout.decode(), stderr.decode()
+        else:
+            # Stream fixed-size chunks: progress shows up live, nothing accumulates,
+            # and there is no line-length limit as with StreamReader.readline()
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            while chunk := await proc.stdout.read(65536):
+                sys.stdout.write(decoder.decode(chunk))
+                # Partial lines (progress dots, prompts) must not sit in our buffer
+                sys.stdout.flush()
+            sys.stdout.write(decoder.decode(b"", final=True))
+            sys.stdout.flush()
+            await proc.wait()
+    finally:
+        # Never leave the child running (or unreaped) if streaming was interrupted
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+    return _finish(subprocess.CompletedProcess(cmd, proc.returncode, output, errors), check)
+
+
+def _finish(result, check):
+    if result.returncode != 0:
+        _report_failure(result.args, result.stderr or result.stdout)
         if check:
             sys.exit(1)
-        return e
+    return result
+
+
+async def _spawn(cmd, argv, check, capture):
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=_stderr_target(capture),
+            # Python children block-buffer into a pipe; make them write through
+            env={**os.environ, "PYTHONUNBUFFERED": "1"},
+        )
+    except OSError as e:
+        # e.g. a missing executable; 127 is what a shell would have returned
+        return _finish(subprocess.CompletedProcess(cmd, 127, "", str(e)), check)
+    return await _collect(cmd, proc, check, capture)
+
+
+def _stderr_target(capture):
+    """Merge stderr into the live stream, but keep it apart from captured output."""
+    return asyncio.subprocess.PIPE if capture else asyncio.subprocess.STDOUT
+
+
+async def run_command_async(argv, check=True, capture=False):
+    cmd = shlex.join(argv)
+    print(f"🔄 Running: {cmd}")
+    return await _spawn(cmd, argv, check, capture)
+
+
+async def run_batch(argvs, check=True, capture=False):
+    """Run dependent commands as one ``bash -c 'a && b && c'`` process."""
+    joined = " && ".join(shlex.join(argv) for argv in argvs)
+    print(f"🔄 Running: {joined}")
+    return await _spawn(joined, ["bash", "-c", joined], check, capture)
+
+
+async def run_commands_concurrently(*argvs):
+    """Run independent commands in parallel; exit if any of them failed.
+
+    Output is captured and printed per command once all have finished, so
+    parallel runs do not interleave on the terminal.
+    """
+    results = await asyncio.gather(
+        *(run_command_async(argv, check=False, capture=True) for argv in argvs),
+        return_exceptions=True,
+    )
+    failed = False
+    for argv, result in zip(argvs, results):
+        if isinstance(result, BaseException):
+            print(f"❌ Command failed: {shlex.join(argv)}")
+            print(f"Error: {result}")
+            failed = True
+            continue
+        print(f"── {shlex.join(argv)}")
+        for stream in (result.stdout, result.stderr):
+            if stream:
+                print(stream, end="" if stream.endswith("\n") else "\n")
+        if result.returncode != 0:
+            failed = True
+    if failed:
+        sys.exit(1)
+    return results
 
 
 def get_current_version():
-    init_file = Path("src/qqgjyx/__init__.py")
-    with open(init_file) as f:
-        content = f.read()
-        match = re.search(r'__version__ = "([^"]+)"', content)
-        if match:
-            return match.group(1)
+    match = _VERSION_PY_RE.search(INIT_FILE.read_text())
+    if match:
+        return match.group(1)
     raise ValueError("Could not find version in __init__.py")
 
 
 def update_version(new_version: str) -> None:
     print(f"📝 Updating version to {new_version}")
 
-    init_file = Path("src/qqgjyx/__init__.py")
-    init_text = init_file.read_text()
-    init_text = re.sub(r'__version__ = "[^"]+"', f'__version__ = "{new_version}"', init_text)
-    init_file.write_text(init_text)
-
-    pyproject_file = Path("pyproject.toml")
-    py_text = pyproject_file.read_text()
-    py_text = re.sub(r'version = "[^"]+"', f'version = "{new_version}"', py_text)
-    pyproject_file.write_text(py_text)
+    for path, pattern, replacement in (
+        (INIT_FILE, _VERSION_PY_RE, f'__version__ = "{new_version}"'),
+        (PYPROJECT_FILE, _VERSION_TOML_RE, f'version = "{new_version}"'),
+    ):
+        text = path.read_text()
+        new_text = pattern.sub(replacement, text)
+        # Skip the write on idempotent re-runs
+        if new_text != text:
+            path.write_text(new_text)
 
     print(f"✅ Version updated to {new_version}")
 
 
-def run_tests(run_all: bool = False) -> None:
+def install_fingerprint() -> str:
+    """Hash the files that affect the editable install's metadata."""
+    data = INSTALL_TARGET.encode() + PYPROJECT_FILE.read_bytes() + INIT_FILE.read_bytes()
+    return hashlib.blake2b(data).hexdigest()
+
+
+async def run_tests(run_all: bool = False, verbose: bool = False) -> None:
     print("🧪 Running tests...")
-    # Install editable
-    run_command("conda run -n pkg-dev python -m pip install -e .")
+    # Install editable, unless nothing changed since the last install
+    fingerprint = install_fingerprint()
+    if INSTALL_HASH_FILE.exists() and INSTALL_HASH_FILE.read_text() == fingerprint:
+        print("⏭️  Editable install is up to date")
+    else:
+        await run_command_async([pkg_python(), "-m", "pip", "install", "-e", INSTALL_TARGET])
+        INSTALL_HASH_FILE.parent.mkdir(exist_ok=True)
+        INSTALL_HASH_FILE.write_text(fingerprint)
     # Prefer lightweight tests by default
     test_target = "test/" if run_all else "test/test_basic.py"
-    result = run_command(f"conda run -n pkg-dev python -m pytest {test_target} -v")
+    argv = [pkg_python(), "-m", "pytest", test_target, "-v" if verbose else "-q"]
+    if run_all:
+        # Spread test files across cores with pytest-xdist; a single file would
+        # land on one worker and the others would be pure startup cost
+        argv += ["-n", "auto", "--dist=loadfile"]
+    result = await run_command_async(argv)
     if result.returncode == 0:
         print("✅ Tests passed!")
     else:
@@ -81,10 +207,11 @@ def run_tests(run_all: bool = False) -> None:
         sys.exit(1)
 
 
-def build_package() -> None:
+async def build_package() -> None:
     print("📦 Building package...")
-    run_command("rm -rf dist build")
-    result = run_command("conda run -n pkg-dev python -m build")
+    for d in ("dist", "build"):
+        shutil.rmtree(d, ignore_errors=True)
+    result = await run_command_async([pkg_python(), "-m", "build"])
     if result.returncode == 0:
         print("✅ Package built successfully!")
     else:
@@ -92,19 +219,21 @@ def build_package() -> None:
         sys.exit(1)
 
 
-def validate_package() -> None:
+async def validate_package() -> None:
     print("🔍 Validating package...")
-    result = run_command("conda run -n pkg-dev twine check dist/*")
-    if result.returncode == 0:
-        print("✅ Package validation passed!")
-    else:
-        print("❌ Package validation failed!")
+    # Check sdist and wheel side by side rather than one after the other
+    artifacts = sorted(str(p) for p in Path("dist").glob("*"))
+    if not artifacts:
+        print("❌ Package validation failed: no artifacts in dist/")
         sys.exit(1)
+    await run_commands_concurrently(*([pkg_python(), "-m", "twine", "check", a] for a in artifacts))
+    print("✅ Package validation passed!")
 
 
-def upload_package() -> None:
+async def upload_package() -> None:
     print("🚀 Uploading to PyPI...")
-    result = run_command("conda run -n pkg-dev twine upload dist/*")
+    artifacts = sorted(str(p) for p in Path("dist").glob("*"))
+    result = await run_command_async([pkg_python(), "-m", "twine", "upload", *artifacts])
     if result.returncode == 0:
         print("✅ Package uploaded successfully!")
     else:
@@ -112,19 +241,24 @@ def upload_package() -> None:
         sys.exit(1)
 
 
-def git_commit_and_tag(version: str, message: str | None) -> None:
+async def git_commit_and_tag(version: str, message: str | None) -> None:
     print("📝 Committing changes...")
-    run_command("git add -A")
     commit_msg = f"Release {version}: {message}" if message else f"Release {version}"
-    run_command(f'git commit -m "{commit_msg}"')
-    run_command(f'git tag -a v{version} -m "qqgjyx {version}"')
-    run_command("git push")
-    run_command("git push --tags")
+    await run_batch(
+        [
+            ["git", "add", "-A"],
+            ["git", "commit", "-m", commit_msg],
+            ["git", "tag", "-a", f"v{version}", "-m", f"qqgjyx {version}"],
+        ]
+    )
+    # One atomic push: the remote gets both the branch and the tag, or neither
+    await run_command_async(["git", "push", "--atomic", "origin", "HEAD", f"v{version}"])
     print(f"✅ Git commit and tag v{version} created!")
 
 
-def check_git_status() -> None:
-    result = run_command("git status --porcelain", check=False)
+async def check_git_status() -> None:
+    # A failing git status (e.g. not a repository) aborts instead of looking dirty
+    result = await run_command_async(["git", "status", "--porcelain"], capture=True)
     if result.stdout.strip():
         print("⚠️  Warning: You have uncommitted changes:")
         print(result.stdout)
@@ -133,13 +267,14 @@ def check_git_status() -> None:
             sys.exit(0)
 
 
-def main() -> None:
+async def main() -> None:
     parser = argparse.ArgumentParser(description="Deploy qqgjyx package")
     parser.add_argument("--version", help="New version number (e.g., 0.1.3)")
     parser.add_argument("--message", help="Commit message")
     parser.add_argument("--skip-tests", action="store_true", help="Skip running tests")
     parser.add_argument("--skip-upload", action="store_true", help="Skip PyPI upload")
     parser.add_argument("--all-tests", action="store_true", help="Run full test suite (may require optional deps)")
+    parser.add_argument("--verbose", action="store_true", help="Show per-test output")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be done without executing")
 
     args = parser.parse_args()
@@ -147,7 +282,7 @@ def main() -> None:
     print("🚀 qqgjyx Deployment Script")
     print("=" * 40)
 
-    check_git_status()
+    await check_git_status()
 
     current_version = get_current_version()
     print(f"📋 Current version: {current_version}")
@@ -168,19 +303,19 @@ def main() -> None:
     update_version(new_version)
 
     if not args.skip_tests:
-        run_tests(run_all=args.all_tests)
+        await run_tests(run_all=args.all_tests, verbose=args.verbose)
     else:
         print("⏭️  Skipping tests")
 
-    build_package()
-    validate_package()
+    await build_package()
+    await validate_package()
 
     if not args.skip_upload:
-        upload_package()
+        await upload_package()
     else:
         print("⏭️  Skipping PyPI upload")
 
-    git_commit_and_tag(new_version, args.message)
+    await git_commit_and_tag(new_version, args.message)
 
     print("\n🎉 Deployment completed successfully!")
     print(f"📦 Package: qqgjyx {new_version}")
@@ -189,4 +324,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -1,11 +1,12 @@
 """Dataset utilities."""
 
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
-from torch.utils.data import Dataset, random_split
+if TYPE_CHECKING:
+    from torch.utils.data import Dataset
 
 
-def split(train_set: Dataset, val_ratio: float = 0.2, seed: int = 42) -> Tuple[Dataset, Dataset]:
+def split(train_set: "Dataset", val_ratio: float = 0.2, seed: int = 42) -> Tuple["Dataset", "Dataset"]:
     """
     Split the dataset into training and validation sets.
 
@@ -23,12 +24,16 @@ def split(train_set: Dataset, val_ratio: float = 0.2, seed: int = 42) -> Tuple[D
     Tuple[Dataset, Dataset]
         The training and validation datasets.
     """
-    train_set_size = int(len(train_set) * (1 - val_ratio))
-    val_set_size = len(train_set) - train_set_size
-    generator = torch.Generator().manual_seed(seed)
-    train_subset, val_subset = random_split(
-        train_set, [train_set_size, val_set_size], generator=generator
-    )
+    # Lazy imports to avoid heavy deps at import time
+    import numpy as np  # type: ignore
+    from torch.utils.data import Subset  # type: ignore
+
+    n = len(train_set)
+    train_set_size = int(n * (1 - val_ratio))
+    # NumPy's vectorized permutation is much faster than torch.randperm on CPU
+    perm = np.random.default_rng(seed).permutation(n)
+    train_subset = Subset(train_set, perm[:train_set_size].tolist())
+    val_subset = Subset(train_set, perm[train_set_size:].tolist())
     return train_subset, val_subset
 
 
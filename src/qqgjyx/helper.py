@@ -2,7 +2,12 @@
 
 import platform
 import sys
-from typing import Optional
+from typing import List, Optional
+
+
+def _emit(lines: List[str]) -> None:
+    """Write a block of lines in one call (one message frame in Jupyter)."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def env() -> None:
@@ -11,12 +16,16 @@ def env() -> None:
     import numpy as np  # type: ignore
     import torch  # type: ignore
 
-    print("\n=== Environment Information ===")
-    print(f"Python version: {sys.version.split()[0]}")
-    print(f"PyTorch version: {getattr(torch, '__version__', 'N/A')}")
-    print(f"NumPy version: {getattr(np, '__version__', 'N/A')}")
-    print(f"Platform: {platform.platform()}")
-    print("============================\n")
+    _emit(
+        [
+            "\n=== Environment Information ===",
+            f"Python version: {sys.version.split()[0]}",
+            f"PyTorch version: {getattr(torch, '__version__', 'N/A')}",
+            f"NumPy version: {getattr(np, '__version__', 'N/A')}",
+            f"Platform: {platform.platform()}",
+            "============================\n",
+        ]
+    )
 
 
 def dev() -> "object":
@@ -30,38 +39,59 @@ def dev() -> "object":
     import torch  # type: ignore
 
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-    print("\n=== Device Information ===")
-    print(f"CUDA available: {torch.cuda.is_available()}")
+    lines = ["\n=== Device Information ===", f"CUDA available: {torch.cuda.is_available()}"]
     if device.type == "cuda":
-        print(f"CUDA version: {torch.version.cuda}")
-        print(f"CUDA device count: {torch.cuda.device_count()}")
-        print(f"Current CUDA device: {torch.cuda.current_device()}")
-        print(f"GPU: {torch.cuda.get_device_name()}")
-    print(f"Using device: {device}")
-    print("========================\n")
+        lines += [
+            f"CUDA version: {torch.version.cuda}",
+            f"CUDA device count: {torch.cuda.device_count()}",
+            f"Current CUDA device: {torch.cuda.current_device()}",
+            f"GPU: {torch.cuda.get_device_name()}",
+        ]
+    lines += [f"Using device: {device}", "========================\n"]
+    _emit(lines)
     return device
 
 
-def seed(seed_value: int = 42) -> int:
-    """Set all seeds for reproducibility."""
-    import numpy as np  # type: ignore
+def seed(seed_value: int = 42, *, deterministic: bool = False, verbose: bool = False) -> int:
+    """Set all seeds for reproducibility.
+
+    ``pl.seed_everything`` already seeds Python's ``random``, NumPy and torch
+    (CPU and all CUDA devices), so no per-library calls are needed here.
+
+    Parameters
+    ----------
+    seed_value : int, optional
+        The seed to use (default is 42).
+    deterministic : bool, optional
+        Force deterministic cuDNN kernels and disable the cuDNN autotuner
+        (default is False). This makes GPU runs bit-for-bit repeatable but
+        is often 1.5-3x slower for convolutions, so it is opt-in.
+    verbose : bool, optional
+        Print a summary of what was configured (default is False).
+
+    Returns
+    -------
+    int
+        The seed that was set.
+    """
     import pytorch_lightning as pl  # type: ignore
-    import torch  # type: ignore
 
-    print("\n=== Setting Random Seeds ===")
-    print(f"Seed value: {seed_value}")
-    print("Setting torch CPU seed...")
-    torch.manual_seed(seed_value)
-    print("Setting torch CUDA seed...")
-    torch.cuda.manual_seed_all(seed_value)
-    print("Setting numpy seed...")
-    np.random.seed(seed_value)
-    print("Configuring CUDNN...")
-    torch.backends.cudnn.deterministic = True
-    torch.backends.cudnn.benchmark = False
-    print("Configuring PL...")
     pl.seed_everything(seed_value, workers=True)
-    print("========================\n")
+    if deterministic:
+        import torch  # type: ignore
+
+        torch.backends.cudnn.deterministic = True
+        torch.backends.cudnn.benchmark = False
+    if verbose:
+        lines = [
+            "\n=== Setting Random Seeds ===",
+            f"Seed value: {seed_value}",
+            "Seeded python, numpy, torch CPU/CUDA via PL",
+        ]
+        if deterministic:
+            lines.append("CUDNN: deterministic=True, benchmark=False")
+        lines.append("========================\n")
+        _emit(lines)
     return seed_value
 
 
@@ -1,5 +1,8 @@
 """Main QQ class providing unified interface to qqgjyx utilities."""
 
+# These modules defer their heavy imports to call time, so binding them here is cheap
+from . import data, helper, visual
+
 
 class QQ:
     """Main interface for qqgjyx utilities."""
@@ -7,32 +10,27 @@ class QQ:
     @staticmethod
     def env():
         """Show environment info."""
-        from .helper import env
-        return env()
+        return helper.env()
     
     @staticmethod
     def dev():
         """Get device info."""
-        from .helper import dev
-        return dev()
+        return helper.dev()
     
     @staticmethod
-    def seed(value=42):
+    def seed(value=42, *, deterministic=False, verbose=False):
         """Set all seeds."""
-        from .helper import seed
-        return seed(value)
+        return helper.seed(value, deterministic=deterministic, verbose=verbose)
     
     @staticmethod
-    def style():
+    def style(dpi_screen=100, dpi_save=600):
         """Set matplotlib style."""
-        from .visual import style
-        return style()
+        return visual.style(dpi_screen=dpi_screen, dpi_save=dpi_save)
     
     @staticmethod
     def split(dataset, val_ratio=0.2, seed=42):
         """Split dataset."""
-        from .data import split
-        return split(dataset, val_ratio, seed)
+        return data.split(dataset, val_ratio, seed)
     
     @staticmethod
     def help():
@@ -1,19 +1,28 @@
 """Visualization helpers for matplotlib styling."""
 
-import matplotlib.pyplot as plt
-import scienceplots  # noqa: F401  # register 'science' style
 
-
-def style() -> None:
-    """Set the style for matplotlib."""
-    plt.style.use("science")
+def style(dpi_screen: int = 100, dpi_save: int = 600) -> None:
+    """Set the style for matplotlib (imports on demand).
+
+    Parameters
+    ----------
+    dpi_screen : int, optional
+        Resolution for on-screen/notebook rendering (default is 100).
+    dpi_save : int, optional
+        Resolution for ``savefig`` output (default is 600).
+    """
+    # Lazy imports to avoid heavy deps at import time
+    import matplotlib.pyplot as plt  # type: ignore
+    import scienceplots  # type: ignore  # noqa: F401  # register 'science' style
+
+    plt.style.use(["science"])
     plt.rcParams.update(
         {
             "pdf.fonttype": 42,
             "ps.fonttype": 42,
             "font.family": "sans-serif",
-            "figure.dpi": 600,
-            "savefig.dpi": 600,
+            "figure.dpi": dpi_screen,
+            "savefig.dpi": dpi_save,
             "figure.figsize": (10, 7),
             "font.size": 13,
             "axes.labelsize": 17,
@@ -0,0 +1,13 @@
+"""Shared pytest configuration for the qqgjyx test suite."""
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """Import the package and all subpackages once for the whole session."""
+    import qqgjyx
+    import qqgjyx.data
+    import qqgjyx.graph
+    import qqgjyx.model
+    import qqgjyx.visual
@@ -1,47 +1,44 @@
 """Basic test suite for qqgjyx core functionality."""
 
+import sys
+from importlib.metadata import version
+
 import pytest
 from unittest.mock import patch, MagicMock
 
+import qqgjyx
+from qqgjyx import QQ, __version__, exceptor, helper, validator, visual
+from qqgjyx.exceptor import QQGJYXError
+from qqgjyx.helper import (print_environment_info, get_device_info, set_all_seeds,
+                           env, dev, seed)
+from qqgjyx.validator import ensure_between
+from qqgjyx.visual import set_plt_style, style
+
+QQ_METHODS = {"help", "env", "dev", "seed", "style", "split"}
+
 
 class TestQQClass:
     """Test the main QQ class interface."""
     
     def test_qq_import(self):
         """Test QQ class can be imported."""
-        from qqgjyx import QQ
         assert QQ is not None
-        assert hasattr(QQ, 'help')
-        assert hasattr(QQ, 'env')
-        assert hasattr(QQ, 'dev')
-        assert hasattr(QQ, 'seed')
-        assert hasattr(QQ, 'style')
-        assert hasattr(QQ, 'split')
+        missing = QQ_METHODS - set(dir(QQ))
+        assert not missing, f"missing: {missing}"
     
     def test_qq_help(self, capsys):
         """Test QQ.help() function."""
-        from qqgjyx import QQ
         QQ.help()
-        captured = capsys.readouterr()
-        assert "QQ Utilities:" in captured.out
-        assert "QQ.env()" in captured.out
-        assert "QQ.dev()" in captured.out
-        assert "QQ.seed(n)" in captured.out
-        assert "QQ.style()" in captured.out
-        assert "QQ.split(d)" in captured.out
-        assert "QQ.help()" in captured.out
+        out = capsys.readouterr().out
+        required = ("QQ Utilities:", "QQ.env()", "QQ.dev()", "QQ.seed(n)", "QQ.style()", "QQ.split(d)", "QQ.help()")
+        missing = [s for s in required if s not in out]
+        assert not missing, f"missing: {missing}"
     
     def test_qq_methods_exist(self):
         """Test that all QQ methods exist and are callable."""
-        from qqgjyx import QQ
-        
-        # Test that methods exist
-        assert callable(QQ.env)
-        assert callable(QQ.dev)
-        assert callable(QQ.seed)
-        assert callable(QQ.style)
-        assert callable(QQ.split)
-        assert callable(QQ.help)
+        methods = {name: getattr(QQ, name) for name in QQ_METHODS}
+        not_callable = [name for name, fn in methods.items() if not callable(fn)]
+        assert not not_callable, f"not callable: {not_callable}"
 
 
 class TestHelperModule:
@@ -49,13 +46,35 @@ class TestHelperModule:
     
     def test_backward_compatibility(self):
         """Test backward compatibility aliases."""
-        from qqgjyx.helper import print_environment_info, get_device_info, set_all_seeds
-        from qqgjyx.helper import env, dev, seed
-        
         # Test that aliases point to new functions
-        assert print_environment_info == env
-        assert get_device_info == dev
-        assert set_all_seeds == seed
+        assert print_environment_info is env
+        assert get_device_info is dev
+        assert set_all_seeds is seed
+    
+    def test_seed_function(self, capsys, monkeypatch):
+        mock_pl = MagicMock()
+        monkeypatch.setitem(sys.modules, "pytorch_lightning", mock_pl)
+        # Silent by default
+        assert helper.seed(42) == 42
+        assert capsys.readouterr().out == ""
+        assert helper.seed(42, verbose=True) == 42
+        out = capsys.readouterr().out
+        missing = [s for s in ("Setting Random Seeds", "Seed value: 42") if s not in out]
+        assert not missing, f"missing: {missing}"
+        assert mock_pl.seed_everything.call_count == 2
+        mock_pl.seed_everything.assert_called_with(42, workers=True)
+    
+    @pytest.mark.parametrize("deterministic", [False, True])
+    def test_seed_deterministic(self, monkeypatch, deterministic):
+        mock_torch = MagicMock()
+        # Start from the non-deterministic defaults so any change is visible
+        mock_torch.backends.cudnn.deterministic = False
+        mock_torch.backends.cudnn.benchmark = True
+        monkeypatch.setitem(sys.modules, "pytorch_lightning", MagicMock())
+        monkeypatch.setitem(sys.modules, "torch", mock_torch)
+        helper.seed(42, deterministic=deterministic)
+        assert mock_torch.backends.cudnn.deterministic is deterministic
+        assert mock_torch.backends.cudnn.benchmark is not deterministic
 
 
 class TestVisualModule:
@@ -63,31 +82,46 @@ class TestVisualModule:
     
     def test_backward_compatibility(self):
         """Test backward compatibility aliases."""
-        from qqgjyx.visual import set_plt_style, style
-        assert set_plt_style == style
+        assert set_plt_style is style
+    
+    @pytest.fixture
+    def mock_plt(self, monkeypatch):
+        # style() imports matplotlib lazily, so stub the modules it imports
+        mock_plt = MagicMock()
+        monkeypatch.setitem(sys.modules, "matplotlib", MagicMock(pyplot=mock_plt))
+        monkeypatch.setitem(sys.modules, "matplotlib.pyplot", mock_plt)
+        monkeypatch.setitem(sys.modules, "scienceplots", MagicMock())
+        return mock_plt
+    
+    def test_style_function(self, mock_plt):
+        style()
+        mock_plt.style.use.assert_called_with(["science"])
+        assert mock_plt.rcParams.update.called
+    
+    @pytest.mark.parametrize(
+        "kwargs,screen,save",
+        [({}, 100, 600), ({"dpi_screen": 150, "dpi_save": 300}, 150, 300)],
+    )
+    def test_style_dpi(self, mock_plt, kwargs, screen, save):
+        style(**kwargs)
+        (params,), _ = mock_plt.rcParams.update.call_args
+        assert params["figure.dpi"] == screen
+        assert params["savefig.dpi"] == save
 
 
 class TestValidatorModule:
     """Test validator module functions."""
     
-    def test_ensure_between_valid(self):
+    @pytest.mark.parametrize("value,low,high", [(5, 0, 10), (0, 0, 10), (10, 0, 10), (0.5, 0.0, 1.0)])
+    def test_ensure_between_valid(self, value, low, high):
         """Test ensure_between with valid values."""
-        from qqgjyx.validator import ensure_between
-        
-        assert ensure_between(5, 0, 10) == 5
-        assert ensure_between(0, 0, 10) == 0
-        assert ensure_between(10, 0, 10) == 10
-        assert ensure_between(0.5, 0.0, 1.0) == 0.5
+        assert ensure_between(value, low, high) == value
     
-    def test_ensure_between_invalid(self):
+    @pytest.mark.parametrize("value,low,high,name", [(-1, 0, 10, "value"), (11, 0, 10, "value"), (-5, 0, 10, "custom")])
+    def test_ensure_between_invalid(self, value, low, high, name):
         """Test ensure_between with invalid values."""
-        from qqgjyx.validator import ensure_between
-        
-        with pytest.raises(ValueError):
-            ensure_between(-1, 0, 10)
-        
-        with pytest.raises(ValueError):
-            ensure_between(11, 0, 10)
+        with pytest.raises(ValueError, match=name):
+            ensure_between(value, low, high, name)
 
 
 class TestExceptorModule:
@@ -95,8 +129,6 @@ class TestExceptorModule:
     
     def test_qqgjyx_error(self):
         """Test QQGJYXError exception."""
-        from qqgjyx.exceptor import QQGJYXError
-        
         with pytest.raises(QQGJYXError):
             raise QQGJYXError("Test error")
         
@@ -108,32 +140,20 @@ class TestPackageStructure:
     """Test package structure and imports."""
     
     def test_package_imports(self):
-        """Test core package imports work."""
-        import qqgjyx
-        from qqgjyx import QQ
-        from qqgjyx.helper import env, dev, seed
-        from qqgjyx.validator import ensure_between
-        from qqgjyx.exceptor import QQGJYXError
-        
-        assert qqgjyx.__version__ == "0.1.2"
-        assert QQ is not None
+        """Test the top-level package exports exactly what it advertises."""
+        assert set(qqgjyx.__all__) == {"__version__", "QQ"}
+        missing = [name for name in qqgjyx.__all__ if not hasattr(qqgjyx, name)]
+        assert not missing, f"missing: {missing}"
     
     def test_subpackage_imports(self):
         """Test subpackage imports."""
-        import qqgjyx.graph
-        import qqgjyx.model
-        
-        # Test that subpackages exist
-        assert hasattr(qqgjyx, 'graph')
-        assert hasattr(qqgjyx, 'model')
+        # Subpackages are imported once per session by conftest._warm_imports
+        missing = [name for name in ("graph", "model", "visual", "data") if not hasattr(qqgjyx, name)]
+        assert not missing, f"missing subpackages: {missing}"
     
     def test_version_consistency(self):
-        """Test version consistency across modules."""
-        import qqgjyx
-        from qqgjyx import __version__
-        
-        assert qqgjyx.__version__ == __version__
-        assert __version__ == "0.1.2"
+        """Test __version__ matches the installed package metadata."""
+        assert __version__ == version("qqgjyx")
 
 
 class TestModuleStructure:
@@ -141,35 +161,23 @@ class TestModuleStructure:
     
     def test_helper_module_structure(self):
         """Test helper module structure."""
-        from qqgjyx.helper import __all__
-        
-        expected_exports = ['env', 'dev', 'seed']
-        for export in expected_exports:
-            assert export in __all__
+        missing = {'env', 'dev', 'seed'} - set(helper.__all__)
+        assert not missing, f"missing from __all__: {missing}"
     
     def test_visual_module_structure(self):
         """Test visual module structure."""
-        from qqgjyx.visual import __all__
-        
-        expected_exports = ['style']
-        for export in expected_exports:
-            assert export in __all__
+        missing = {'style'} - set(visual.__all__)
+        assert not missing, f"missing from __all__: {missing}"
     
     def test_validator_module_structure(self):
         """Test validator module structure."""
-        from qqgjyx.validator import __all__
-        
-        expected_exports = ['ensure_between']
-        for export in expected_exports:
-            assert export in __all__
+        missing = {'ensure_between'} - set(validator.__all__)
+        assert not missing, f"missing from __all__: {missing}"
     
     def test_exceptor_module_structure(self):
         """Test exceptor module structure."""
-        from qqgjyx.exceptor import __all__
-        
-        expected_exports = ['QQGJYXError']
-        for export in expected_exports:
-            assert export in __all__
+        missing = {'QQGJYXError'} - set(exceptor.__all__)
+        assert not missing, f"missing from __all__: {missing}"
 
 
 if __name__ == "__main__":